@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Evin Dunn
+# SPDX-License-Identifier: MIT
+
+"""
+Packing of LCD bytes into PCF8574 packets
+"""
+
+# Enable (E) bit of a PCF8574 packet
+_FLAG_DATA_ENABLE = 0b0100
+
+# High & low nibbles of every byte, shifted into D7-D4 of a PCF8574 packet
+_HI_NIB = bytes([byte & 0b11110000 for byte in range(256)])
+_LO_NIB = bytes([(byte & 0b00001111) << 4 for byte in range(256)])
+
+
+def pack_frame(buf, idx: int, byte: int, lsb: int):
+    """
+    Writes the 4 PCF8574 packets that send the given byte to the LCD into
+    buf[idx:idx + 4]: the high nibble with E high, then low, followed by the
+    low nibble with E high, then low
+    :param buf: The bytearray to write the packets into
+    :param idx: The index of buf to start writing at
+    :param byte: The 0-255 int to send to the LCD
+    :param lsb: The backlight, RWB and RS bits of each packet
+    """
+    val_nib_high = _HI_NIB[byte] | lsb
+    val_nib_low = _LO_NIB[byte] | lsb
+    buf[idx] = val_nib_high | _FLAG_DATA_ENABLE
+    buf[idx + 1] = val_nib_high
+    buf[idx + 2] = val_nib_low | _FLAG_DATA_ENABLE
+    buf[idx + 3] = val_nib_low
+
+
+def pack_frames(buf, idx: int, data, lsb: int) -> int:
+    """
+    Packs every byte of data into buf the same way as pack_frame, starting
+    at idx, so that a whole row of characters takes a single call
+    :param buf: The bytearray to write the packets into
+    :param idx: The index of buf to start writing at
+    :param data: The 0-255 ints to send to the LCD
+    :param lsb: The backlight, RWB and RS bits of each packet
+    :return: The index of buf following the packed bytes
+    """
+    for byte in data:
+        val_nib_high = _HI_NIB[byte] | lsb
+        val_nib_low = _LO_NIB[byte] | lsb
+        buf[idx] = val_nib_high | _FLAG_DATA_ENABLE
+        buf[idx + 1] = val_nib_high
+        buf[idx + 2] = val_nib_low | _FLAG_DATA_ENABLE
+        buf[idx + 3] = val_nib_low
+        idx += 4
+    return idx
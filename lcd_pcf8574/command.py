@@ -11,6 +11,33 @@ except ImportError:
     pass
 
 
+# Instruction types & arguments. The classes below expose them publicly, but
+# the static methods use these so that each is a single global lookup.
+_TYPE_DISPLAY_CLEAR = 0b00000001
+_TYPE_RETURN_HOME = 0b00000010
+_TYPE_ENTRY_MODE_SET = 0b00000100
+_TYPE_DISPLAY_CONTROL = 0b00001000
+_TYPE_CURSOR_DISPLAY_SHIFT = 0b00010000
+_TYPE_FUNCTION_SET = 0b00100000
+_TYPE_CGRAM_ADDR_SET = 0b01000000
+_TYPE_DDRAM_ADDR_SET = 0b10000000
+_TYPE_BUSY_FLAG_READ = 0b00000000
+
+_ENTRY_MODE_INCREMENT_ADDRESS = 0b00000010
+_ENTRY_MODE_SHIFT_DISPLAY = 0b00000001
+
+_DISPLAY_CONTROL_DISPLAY_ON = 0b00000100
+_DISPLAY_CONTROL_CURSOR_ON = 0b00000010
+_DISPLAY_CONTROL_BLINK_ON = 0b00000001
+
+_CURSOR_CONTROL_SHIFT_DISPLAY = 0b00001000
+_CURSOR_CONTROL_SHIFT_RIGHT = 0b00000100
+
+_FUNCTION_SET_DATA_LENGTH_8_BIT = 0b00010000
+_FUNCTION_SET_MODE_2_LINE = 0b00001000
+_FUNCTION_SET_FONT_5X10 = 0b00000100
+
+
 # pylint: disable=too-few-public-methods
 class HD44780Instruction:
     """
@@ -25,63 +52,63 @@ class HD44780Instruction:
         Enum representing the type of instruction for the HD44780
         """
 
-        DISPLAY_CLEAR = 0b00000001
-        RETURN_HOME = 0b00000010
-        ENTRY_MODE_SET = 0b00000100
-        DISPLAY_CONTROL = 0b00001000
-        CURSOR_DISPLAY_SHIFT = 0b00010000
-        FUNCTION_SET = 0b00100000
-        CGRAM_ADDR_SET = 0b01000000
-        DDRAM_ADDR_SET = 0b10000000
-        BUSY_FLAG_READ = 0b00000000
+        DISPLAY_CLEAR = _TYPE_DISPLAY_CLEAR
+        RETURN_HOME = _TYPE_RETURN_HOME
+        ENTRY_MODE_SET = _TYPE_ENTRY_MODE_SET
+        DISPLAY_CONTROL = _TYPE_DISPLAY_CONTROL
+        CURSOR_DISPLAY_SHIFT = _TYPE_CURSOR_DISPLAY_SHIFT
+        FUNCTION_SET = _TYPE_FUNCTION_SET
+        CGRAM_ADDR_SET = _TYPE_CGRAM_ADDR_SET
+        DDRAM_ADDR_SET = _TYPE_DDRAM_ADDR_SET
+        BUSY_FLAG_READ = _TYPE_BUSY_FLAG_READ
 
     class ArgsEntryModeSet:
         """
         Arguments for the ENTRY_MODE_SET instruction
         """
 
-        INCREMENT_ADDRESS = 0b00000010
-        SHIFT_DISPLAY = 0b00000001
+        INCREMENT_ADDRESS = _ENTRY_MODE_INCREMENT_ADDRESS
+        SHIFT_DISPLAY = _ENTRY_MODE_SHIFT_DISPLAY
 
     class ArgsDisplayControl:
         """
         Arguments for the DISPLAY_CONTROL instruction
         """
 
-        DISPLAY_ON = 0b00000100
-        CURSOR_ON = 0b00000010
-        BLINK_ON = 0b00000001
+        DISPLAY_ON = _DISPLAY_CONTROL_DISPLAY_ON
+        CURSOR_ON = _DISPLAY_CONTROL_CURSOR_ON
+        BLINK_ON = _DISPLAY_CONTROL_BLINK_ON
 
     class ArgsCursorControl:
         """
         Arguments for the CURSOR_DISPLAY_SHIFT instruction
         """
 
-        SHIFT_DISPLAY = 0b00001000
-        SHIFT_RIGHT = 0b00000100
+        SHIFT_DISPLAY = _CURSOR_CONTROL_SHIFT_DISPLAY
+        SHIFT_RIGHT = _CURSOR_CONTROL_SHIFT_RIGHT
 
     class ArgsFunctionSet:
         """
         Arguments for the FUNCTION_SET instruction
         """
 
-        DATA_LENGTH_8_BIT = 0b00010000
-        MODE_2_LINE = 0b00001000
-        FONT_5X10 = 0b00000100
+        DATA_LENGTH_8_BIT = _FUNCTION_SET_DATA_LENGTH_8_BIT
+        MODE_2_LINE = _FUNCTION_SET_MODE_2_LINE
+        FONT_5X10 = _FUNCTION_SET_FONT_5X10
 
     @staticmethod
     def clear_display() -> int:
         """
         Returns the op code for clearing the LCD
         """
-        return HD44780Instruction.Type.DISPLAY_CLEAR
+        return _TYPE_DISPLAY_CLEAR
 
     @staticmethod
     def return_home() -> int:
         """
         Returns the op code for returning to row 0, column 0 of the LCD
         """
-        return HD44780Instruction.Type.RETURN_HOME
+        return _TYPE_RETURN_HOME
 
     @staticmethod
     def entry_mode_set(address: Literal["increment", "decrement"], shift: bool) -> int:
@@ -93,12 +120,7 @@ class HD44780Instruction:
         :return: The op code for setting the LCD's entry mode with the given
             arguments
         """
-        val = HD44780Instruction.Type.ENTRY_MODE_SET
-        if address == "increment":
-            val |= HD44780Instruction.ArgsEntryModeSet.INCREMENT_ADDRESS
-        if shift:
-            val |= HD44780Instruction.ArgsEntryModeSet.SHIFT_DISPLAY
-        return val
+        return _ENTRY_MODE_SET[(address == "increment") << 1 | bool(shift)]
 
     @staticmethod
     def display_control(display_on: bool, cursor_on: bool, blink_on: bool) -> int:
@@ -110,14 +132,9 @@ class HD44780Instruction:
         :return: The op code for setting the LCD's display settings with the
             given arguments
         """
-        val = HD44780Instruction.Type.DISPLAY_CONTROL
-        if display_on:
-            val |= HD44780Instruction.ArgsDisplayControl.DISPLAY_ON
-        if cursor_on:
-            val |= HD44780Instruction.ArgsDisplayControl.CURSOR_ON
-        if blink_on:
-            val |= HD44780Instruction.ArgsDisplayControl.BLINK_ON
-        return val
+        return _DISPLAY_CONTROL[
+            bool(display_on) << 2 | bool(cursor_on) << 1 | bool(blink_on)
+        ]
 
     @staticmethod
     def cursor_control(
@@ -130,12 +147,7 @@ class HD44780Instruction:
         :return: The op code for controlling the LCD's cursor with the given
             arguments
         """
-        val = HD44780Instruction.Type.CURSOR_DISPLAY_SHIFT
-        if shift == "display":
-            val |= HD44780Instruction.ArgsCursorControl.SHIFT_DISPLAY
-        if direction == "right":
-            val |= HD44780Instruction.ArgsCursorControl.SHIFT_RIGHT
-        return val
+        return _CURSOR_CONTROL[(shift == "display") << 1 | (direction == "right")]
 
     @staticmethod
     def function_set(
@@ -147,14 +159,7 @@ class HD44780Instruction:
         :param font: Whether to use the 5x10 or 5x10 font
         :return: The op code for configuring the LCD with the given arguments
         """
-        val = HD44780Instruction.Type.FUNCTION_SET
-        if bits == 8:
-            val |= HD44780Instruction.ArgsFunctionSet.DATA_LENGTH_8_BIT
-        if lines == 2:
-            val |= HD44780Instruction.ArgsFunctionSet.MODE_2_LINE
-        if font == "5x10":
-            val |= HD44780Instruction.ArgsFunctionSet.FONT_5X10
-        return val
+        return _FUNCTION_SET[(bits == 8) << 2 | (lines == 2) << 1 | (font == "5x10")]
 
     @staticmethod
     def cgram_address_set(address: int) -> int:
@@ -163,7 +168,7 @@ class HD44780Instruction:
         :return: The op code for setting the cgram address to the given
             value
         """
-        return HD44780Instruction.Type.CGRAM_ADDR_SET | address
+        return _TYPE_CGRAM_ADDR_SET | address
 
     @staticmethod
     def ddram_address_set(address: int) -> int:
@@ -172,11 +177,52 @@ class HD44780Instruction:
         :return: The op code for setting the cgram address to the given
             value
         """
-        return HD44780Instruction.Type.DDRAM_ADDR_SET | address
+        return _TYPE_DDRAM_ADDR_SET | address
 
     @staticmethod
     def read_busy_flag() -> int:
         """
         :return: The op code for reading the busy flag of the LCD
         """
-        return HD44780Instruction.Type.BUSY_FLAG_READ
+        return _TYPE_BUSY_FLAG_READ
+
+
+def _op_table(instruction: int, *flags: int) -> bytes:
+    """
+    :param instruction: The instruction type
+    :param flags: The instruction's argument flags
+    :return: The op codes for every combination of the given flags, indexed
+        by one bit per flag, with the first flag as the most significant bit
+    """
+    table = bytearray()
+    for idx in range(1 << len(flags)):
+        op_code = instruction
+        for bit, flag in enumerate(reversed(flags)):
+            if idx & (1 << bit):
+                op_code |= flag
+        table.append(op_code)
+    return bytes(table)
+
+
+_ENTRY_MODE_SET = _op_table(
+    _TYPE_ENTRY_MODE_SET,
+    _ENTRY_MODE_INCREMENT_ADDRESS,
+    _ENTRY_MODE_SHIFT_DISPLAY,
+)
+_DISPLAY_CONTROL = _op_table(
+    _TYPE_DISPLAY_CONTROL,
+    _DISPLAY_CONTROL_DISPLAY_ON,
+    _DISPLAY_CONTROL_CURSOR_ON,
+    _DISPLAY_CONTROL_BLINK_ON,
+)
+_CURSOR_CONTROL = _op_table(
+    _TYPE_CURSOR_DISPLAY_SHIFT,
+    _CURSOR_CONTROL_SHIFT_DISPLAY,
+    _CURSOR_CONTROL_SHIFT_RIGHT,
+)
+_FUNCTION_SET = _op_table(
+    _TYPE_FUNCTION_SET,
+    _FUNCTION_SET_DATA_LENGTH_8_BIT,
+    _FUNCTION_SET_MODE_2_LINE,
+    _FUNCTION_SET_FONT_5X10,
+)
@@ -6,17 +6,23 @@ LCD class for interfacing with PCF8574-based I2C character LCDs
 """
 
 from time import sleep
-from struct import pack, unpack
+
+try:
+    from time import monotonic_ns
+except ImportError:
+    monotonic_ns = None
 
 from busio import I2C
-from adafruit_pcf8574 import PCF8574
+from adafruit_bus_device.i2c_device import I2CDevice
 
 from .command import HD44780Instruction
+from ._frame import pack_frame, pack_frames
 
 
 DEFAULT_COLUMNS = 16
 DEFAULT_ROWS = 2
 DEFAULT_ADDR = 0x27
+DEFAULT_I2C_FREQUENCY = 100000
 
 MILLISECOND = 1e-3
 MICROSECOND = 1e-6
@@ -30,10 +36,50 @@ FLAG_REGISTER_DATA = 0b0001
 FLAG_REGISTER_INSTRUCTION = 0b0000
 FLAG_LCD_BUSY = 0b10000000
 
+BUSY_POLL_LIMIT = 3
+
+# Instruction execution times from the HD44780 datasheet: 37us for most
+# instructions, 1.52ms for clear & home
+SETTLE_US = 37
+SETTLE_US_LONG = 1600
+
+# Waits shorter than this are spun rather than slept when spin_wait is set,
+# since sleep() on most ports can't go much below a tick
+SPIN_WAIT_LIMIT_US = 100
+
 ADDR_COL_INCREMENT = 0x01
 ADDR_ROW_INCREMENT = 0x40
 
+# Shown in place of characters past the 0-255 range of the character ROM
+CHAR_UNKNOWN = 0x3F
+
+# E-high, E-low packets for the 8-bit and 4-bit FUNCTION_SET instructions of
+# the initialization sequence, sent while the LCD is still reading all 8 data
+# bits per E pulse. D3-D0 of the instruction are the backlight, E, RWB and RS
+# bits, which are all low.
+_FUNCTION_SET_8BIT = HD44780Instruction.function_set(bits=8, lines=1, font="5x8")
+_FUNCTION_SET_4BIT = HD44780Instruction.function_set(bits=4, lines=1, font="5x8")
+_MODESET_8BIT = bytes((_FUNCTION_SET_8BIT | FLAG_DATA_ENABLE, _FUNCTION_SET_8BIT))
+_MODESET_4BIT = bytes((_FUNCTION_SET_4BIT | FLAG_DATA_ENABLE, _FUNCTION_SET_4BIT))
+
+# The PCF8574 powers up with all pins high, so the very first pulse has to
+# start by pulling E low. Every later pulse leaves E low on its own.
+_E_LOW = bytes((0,))
+
+
+def _rom_codes(text: str) -> bytes:
+    """
+    :param text: The string to convert
+    :return: One character ROM code per character of text. Codes 0-255,
+        such as "\xdf" (degree sign), are passed through as-is; anything
+        past that is shown as "?"
+    """
+    # Not str.encode(), which ignores its codec on MicroPython and returns
+    # UTF-8, i.e. several bytes for one character
+    return bytes([code if code < 0x100 else CHAR_UNKNOWN for code in map(ord, text)])
+
 
+# pylint: disable=too-many-instance-attributes
 class LCD:
     """
     PCF8574-based I2C interface to a HD44780-based character LCD. The chips
@@ -50,46 +96,116 @@ class LCD:
 
     # pylint: disable=too-many-arguments
     def __init__(
-        self, sda, scl, address=DEFAULT_ADDR, rows=DEFAULT_ROWS, columns=DEFAULT_COLUMNS
+        self,
+        sda=None,
+        scl=None,
+        address=DEFAULT_ADDR,
+        rows=DEFAULT_ROWS,
+        columns=DEFAULT_COLUMNS,
+        i2c_frequency=DEFAULT_I2C_FREQUENCY,
+        use_busy_flag=False,
+        fast_init=False,
+        i2c=None,
+        spin_wait=False,
     ):
-
-        # Max frequency for the PCF8574 is 100 kHz
-        i2c = I2C(sda=sda, scl=scl, frequency=100000)
-        self.pcf = PCF8574(i2c, address=address)
+        """
+        :param sda: The I2C data pin, required unless i2c is given
+        :param scl: The I2C clock pin, required unless i2c is given
+        :param address: The I2C address of the PCF8574
+        :param rows: The number of rows on the LCD
+        :param columns: The number of columns on the LCD
+        :param i2c_frequency: The I2C bus frequency in Hz, unused if i2c is
+            given. Defaults to the 100 kHz the PCF8574 is specified for, but
+            the PCF8574A and most other parts run fine in 400 kHz fast-mode,
+            which makes every write ~4x faster; pass 400000 once that's
+            verified. Don't go above 400 kHz: the characters of a write go
+            out back to back, relying on each one's ~45us on the bus to
+            cover the time the LCD takes to execute it
+        :param use_busy_flag: Whether to confirm each instruction has finished
+            by reading the LCD's busy flag. Only works if the backpack wires
+            the LCD's RWB pin to the PCF8574; otherwise fixed delays from the
+            datasheet are used
+        :param fast_init: Whether to skip resetting the LCD into 8-bit mode
+            before switching it to 4-bit mode. Saves ~5ms, but only safe
+            when the LCD was just powered on and hasn't been sent anything
+            yet; an LCD left in 4-bit mode (e.g. after a soft reset of the
+            board) will show garbage
+        :param i2c: An existing I2C bus to share, e.g. board.I2C(), instead of
+            creating a new one from sda and scl. Its frequency must not be
+            above 400 kHz, see i2c_frequency
+        :param spin_wait: Whether to busy-wait on time.monotonic_ns() for the
+            ~37us most instructions take, rather than calling sleep(), which
+            can overshoot by far more than that. Ignored if monotonic_ns()
+            isn't available; leave off if its resolution is coarse
+        """
+        if i2c is None:
+            if sda is None or scl is None:
+                raise ValueError("Either i2c or both sda and scl are required")
+            i2c = I2C(sda=sda, scl=scl, frequency=i2c_frequency)
+        self.i2c = I2CDevice(i2c, address)
 
         self._backlight = FLAG_BACKLIGHT_OFF
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
+
+        # Bits 3, 1, and 0 of every I2C write to each register, which only
+        # change with the backlight, see _rebuild_lsb_cache
+        self._lsb_data = 0
+        self._lsb_instruction = 0
+        self._rebuild_lsb_cache()
+
+        # Whether backlight() was called since the last I2C request
+        self._backlight_dirty = False
 
         self._cursor_on = True
         self._blink_on = False
         self._display_on = False
 
+        self._use_busy_flag = use_busy_flag
+        self._spin_wait = spin_wait and monotonic_ns is not None
+
         self._rows = rows
         self._columns = columns
         self._current_row = 0
         self._current_column = 0
 
+        # DDRAM address set op codes for every cursor position, indexed by
+        # row * columns + column
+        self._ddram_addr_set = bytes(
+            [
+                HD44780Instruction.ddram_address_set(
+                    row * ADDR_ROW_INCREMENT + col * ADDR_COL_INCREMENT
+                )
+                for row in range(rows)
+                for col in range(columns)
+            ]
+        )
+
+        # Packets for the bytes being sent, reused so that sending doesn't
+        # allocate. Sized for a full row, grown if ever needed.
+        self._frame_buf = bytearray(4 * columns)
+        self._read_buf = bytearray(5)
+        self._response_buf = bytearray(2)
+
         # Wait for power-on
         sleep(50 * MILLISECOND)
 
         ### Initialization sequence, page 42 of HD44780 datasheet
-        val = (
-            HD44780Instruction.Type.FUNCTION_SET | 
-            HD44780Instruction.ArgsFunctionSet.DATA_LENGTH_8_BIT
-        )
 
-        # Set 8-bit mode
-        for _ in range(3):
-            self.pcf.write_gpio(val)
-            self._pulse_enable(val)
-            sleep(5 * MILLISECOND)
-
-        # Set 4-bit mode
-        val = HD44780Instruction.Type.FUNCTION_SET
-        self.pcf.write_gpio(val)
-        self._pulse_enable(val)
-        sleep(5 * MILLISECOND)
+        if fast_init:
+            # The LCD resets itself into 8-bit mode on a clean power-on, so
+            # it only needs switching to 4-bit mode
+            self._pulse_enable(_E_LOW + _MODESET_4BIT)
+        else:
+            # Set 8-bit mode three times: the LCD needs >4.1ms after the
+            # first and >100us after the second, while the bytes on the bus
+            # before the next E pulse already outlast the 37us the third
+            # takes, so the third and the switch to 4-bit mode go out in the
+            # same I2C write
+            self._pulse_enable(_E_LOW + _MODESET_8BIT)
+            sleep(4.5 * MILLISECOND)
+            self._pulse_enable(_MODESET_8BIT)
+            sleep(150 * MICROSECOND)
+            self._pulse_enable(_MODESET_8BIT + _MODESET_4BIT)
+            self._delay_us(SETTLE_US)
         
         # Set lines, font
         mode_4bit = HD44780Instruction.function_set(
@@ -113,29 +229,44 @@ class LCD:
         ### End initialization sequence
         sleep(MILLISECOND)
 
+        # Turning the display on carries the backlight change with it
         self._display_on = True
-        self._configure_display()
         self.backlight(True)
+        self._configure_display()
 
     def clear(self):
         """
         Clears the display and returns the cursor to the origin
         """
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
         clear_display = HD44780Instruction.clear_display()
-        self._send(clear_display)
+        self._send(clear_display, settle_us=SETTLE_US_LONG)
         self._current_row = 0
         self._current_column = 0
 
     def backlight(self, backlight: bool):
         """
+        The backlight bit is part of every I2C request, so the change goes
+        out with the next instruction or write to the LCD. Call flush() to
+        apply it right away if nothing else is about to be sent.
         :param backlight: Whether the backlight should be enabled
         """
         self._backlight = FLAG_BACKLIGHT_ON if backlight else FLAG_BACKLIGHT_OFF
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
-        self._send_byte(0)
+        self._rebuild_lsb_cache()
+        self._backlight_dirty = True
+
+    def flush(self):
+        """
+        Applies a pending backlight() change without sending anything else
+        to the LCD
+        """
+        if not self._backlight_dirty:
+            return
+
+        # E stays low, so the LCD ignores the rest of the packet
+        self._frame_buf[0] = self._lsb_instruction
+        with self.i2c:
+            self.i2c.write(self._frame_buf, end=1)
+        self._backlight_dirty = False
 
     def cursor(self, cursor: bool):
         """
@@ -155,13 +286,11 @@ class LCD:
         """
         Returns the cursor to the origin without clearing the display
         """
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
         self._current_row = 0
         self._current_column = 0
 
         return_home = HD44780Instruction.return_home()
-        self._send(return_home)
+        self._send(return_home, settle_us=SETTLE_US_LONG)
 
     def set_position(self, row: int, col: int):
         """
@@ -169,60 +298,174 @@ class LCD:
         :param row: zero-indexed cursor row
         :param col: zero-index cursor column
         """
-        prev_write_enable = self._write_enable
-        prev_register = self._register
+        # Packed with the cached instruction register bits, so there's no
+        # read/write or register state to save & restore
+        buf = self._reserve_frames(1)
+        self._write_frames(self._pack_cursor_move(buf, 0, row, col))
 
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
-        self._current_row = row % self._rows
-        self._current_column = col % self._columns
-        cursor_addr = (
-            self._current_row * ADDR_ROW_INCREMENT
-            + self._current_column * ADDR_COL_INCREMENT
-        )
-        ddram_addr_set = HD44780Instruction.ddram_address_set(cursor_addr)
-        self._send(ddram_addr_set)
+    def write(self, value: str):
+        """
+        Writes a string to the LCD at the current cursor position. The
+        string, including the cursor moves for newlines and wrapping, goes
+        out in a single I2C write per screenful of characters, unless
+        use_busy_flag is set, in which case each byte is written and checked
+        on its own.
+        :param value: The string to write to the LCD, one character ROM
+            code (0-255) per character; anything else is shown as "?"
+        """
+        if not value:
+            return
 
-        self._write_enable = prev_write_enable
-        self._register = prev_register
+        data = _rom_codes(value)
 
-    def write(self, value: str):
+        # At most a screenful of characters per I2C write, which keeps
+        # self._frame_buf from growing with the length of the string
+        batch = self._rows * self._columns
+        for start in range(0, len(data), batch):
+            self._write_text(data, start, min(start + batch, len(data)))
+
+    def write_buffer(self, data: bytes, row: int = 0, col: int = 0):
+        """
+        Writes raw character codes to the LCD starting at the given cursor
+        position, wrapping to the next row at the end of each row. Unlike
+        write(), newlines aren't handled, so a whole-display framebuffer of
+        rows * columns bytes can be redrawn in a single I2C write, unless
+        use_busy_flag is set (see write()).
+        :param data: The 0-255 character codes to write to the LCD
+        :param row: zero-indexed cursor row to start at
+        :param col: zero-index cursor column to start at
+        """
+        if not data:
+            return
+
+        # See write()
+        batch = self._rows * self._columns
+        for start in range(0, len(data), batch):
+            end = min(start + batch, len(data))
+            count = end - start
+
+            # The data, the initial cursor move, and a cursor move per wrap
+            buf = self._reserve_frames(count + count // self._columns + 2)
+            idx = 0
+            if start == 0:
+                idx = self._pack_cursor_move(buf, 0, row, col)
+            idx = self._pack_wrapped(buf, idx, data, start, end)
+
+            self._write_frames(idx)
+
+    def write_line(self, row: int, text: str):
         """
-        Writes a string to the LCD at the current cursor position
-        :param value: The string to write to the LCD
+        Replaces the contents of a row with the given string, padded with
+        spaces or truncated to the width of the LCD, in a single I2C write
+        unless use_busy_flag is set (see write()).
+        Strings containing newlines are written with write() instead.
+        :param row: zero-indexed row to write
+        :param text: The string to write to the row, see write()
         """
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_DATA
-        for char in value:
-            if char == "\n" or self._current_column == self._columns:
-                row = (self._current_row + 1) % self._rows
-                col = 0
-                self.set_position(row, col)
+        if "\n" in text:
+            self.set_position(row, 0)
+            self.write(text)
+            return
+
+        data = _rom_codes(text[: self._columns])
+        self.write_buffer(data + b" " * (self._columns - len(data)), row, 0)
 
-            self._send(ord(char))
-            self._current_column += 1
+    def _write_text(self, data: bytes, start: int, end: int):
+        """
+        Writes data[start:end] to the LCD at the cursor position with
+        _write_frames, moving the cursor to the start of the next row for
+        every newline
+        :param data: The character codes to write, see write()
+        :param start: The index of data to start writing from
+        :param end: The index of data to stop writing at
+        """
+        count = end - start
+
+        # The characters, a cursor move per newline, and a cursor move for
+        # each row filled up along the way
+        buf = self._reserve_frames(
+            count
+            + data.count(b"\n", start, end)
+            + (self._current_column + count) // self._columns
+            + 1
+        )
+        idx = 0
+        newline = data.find(b"\n", start, end)
+        while newline >= 0:
+            idx = self._pack_wrapped(buf, idx, data, start, newline)
+            idx = self._pack_cursor_move(buf, idx, self._current_row + 1, 0)
+            start = newline + 1
+            newline = data.find(b"\n", start, end)
+        idx = self._pack_wrapped(buf, idx, data, start, end)
+
+        self._write_frames(idx)
+
+    def _pack_wrapped(self, buf: bytearray, idx: int, data, start: int, end: int):
+        """
+        Packs data[start:end] into buf as characters at the cursor position,
+        moving the cursor to the start of the next row whenever the current
+        one fills up. Each row's worth of characters is packed by a single
+        pack_frames call.
+        :param buf: The bytearray to pack the characters into
+        :param idx: The index of buf to start packing at
+        :param data: The 0-255 character codes to pack
+        :param start: The index of data to start packing from
+        :param end: The index of data to stop packing at
+        :return: The index of buf following the packed characters
+        """
+        view = memoryview(data)
+        lsb = self._lsb_data
+        columns = self._columns
+        while start < end:
+            if self._current_column == columns:
+                idx = self._pack_cursor_move(buf, idx, self._current_row + 1, 0)
+
+            count = min(columns - self._current_column, end - start)
+            idx = pack_frames(buf, idx, view[start : start + count], lsb)
+            self._current_column += count
+            start += count
+        return idx
+
+    def _pack_cursor_move(self, buf: bytearray, idx: int, row: int, col: int) -> int:
+        """
+        Packs the DDRAM address set instruction that moves the cursor to the
+        given position into buf, so it can go out in the same I2C write as
+        the characters around it
+        :param buf: The bytearray to pack the instruction into
+        :param idx: The index of buf to start packing at
+        :param row: zero-indexed cursor row
+        :param col: zero-index cursor column
+        :return: The index of buf following the packed instruction
+        """
+        self._current_row = row % self._rows
+        self._current_column = col % self._columns
+        ddram_addr_set = self._ddram_addr_set[
+            self._current_row * self._columns + self._current_column
+        ]
+        pack_frame(buf, idx, ddram_addr_set, self._lsb_instruction)
+        return idx + 4
 
-    @property
-    def _lsb(self):
+    def _rebuild_lsb_cache(self):
         """
-        Bits 3, 1, and 0 of every I2C request based on the current values
-        of:
-            - Whether the backlight should be turned on
-            - Whether we're reading from or writing to the HD44780 LCD
-            - Whether we're using the instruction or data register of the LCD
+        Recomputes bits 3, 1, and 0 of every I2C write to the data and
+        instruction registers based on whether the backlight should be
+        turned on
 
         PCF8574 SDA: D3        D1  D0
         HD44780 LCD: Backlight RWB RS
+
+        Called whenever the backlight changes, rather than on every byte
         """
-        return self._backlight | self._write_enable | self._register
+        self._lsb_data = self._backlight | FLAG_WRITE_ENABLE | FLAG_REGISTER_DATA
+        self._lsb_instruction = (
+            self._backlight | FLAG_WRITE_ENABLE | FLAG_REGISTER_INSTRUCTION
+        )
 
     def _configure_display(self):
         """
         Configures the display on/off state, cursor on/off state, and blink
         on/off state of the LCD
         """
-        self._write_enable = FLAG_WRITE_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
         display_ctrl = HD44780Instruction.display_control(
             self._display_on, self._cursor_on, self._blink_on
         )
@@ -232,66 +475,156 @@ class LCD:
         """
         Check the LCD busy flag
         """
-        prev_write_enable = self._write_enable
-        self._write_enable = FLAG_READ_ENABLE
+        lsb = self._backlight | FLAG_READ_ENABLE | FLAG_REGISTER_INSTRUCTION
 
-        read_busy_flag = HD44780Instruction.read_busy_flag()
-        response = self._send_byte(read_busy_flag)
-
-        self._write_enable = prev_write_enable
+        # The PCF8574's pins are quasi-bidirectional, so D7-D4 have to be
+        # written high for the LCD to be able to drive them
+        response = self._read_byte(0xFF, lsb)
         return (response & FLAG_LCD_BUSY) > 0
 
-    def _wait_for_ready(self):
+    def _wait_for_ready(self, settle_us: int = SETTLE_US_LONG):
         """
-        Poll the LCD until the ready flag is not set and the LCD is ready to
+        Wait out the expected instruction execution time, then poll the LCD a
+        few times until the ready flag is not set and the LCD is ready to
         accept a new packet
+        :param settle_us: Microseconds to wait before the first poll
         """
-        prev_write_enable = self._write_enable
-        prev_register = self._register
-
-        self._write_enable = FLAG_READ_ENABLE
-        self._register = FLAG_REGISTER_INSTRUCTION
-
-        while self._check_busy():
-            sleep(MILLISECOND)
+        self._delay_us(settle_us)
+        for _ in range(BUSY_POLL_LIMIT):
+            if not self._check_busy():
+                break
+            sleep(200 * MICROSECOND)
 
-        self._write_enable = prev_write_enable
-        self._register = prev_register
-
-    def _send(self, byte: int):
+    def _send(self, byte: int, settle_us: int = SETTLE_US):
         """
-        Send the given byte to the LCD, then poll the busy flag until the LCD
-        is ready again
+        Send the given byte to the LCD, then wait for the LCD to execute it
         :param byte: The 0-255 int to send to the LCD
+        :param settle_us: Microseconds to wait for the instruction to execute
         """
         self._send_byte(byte)
-        self._wait_for_ready()
+        self._wait_for_execution(settle_us)
+
+    def _wait_for_execution(self, settle_us: int):
+        """
+        Wait for the LCD to execute the last instruction sent to it. Most
+        instructions take 37us; polling the busy flag costs several I2C
+        round-trips, which is far longer than that, so the busy flag is only
+        checked if it was asked for.
+        :param settle_us: Microseconds the instruction is expected to take
+        """
+        if self._use_busy_flag:
+            self._wait_for_ready(settle_us)
+        else:
+            self._delay_us(settle_us)
 
-    def _pulse_enable(self, byte: int) -> int:
+    def _delay_us(self, microseconds: int):
+        """
+        Waits for the given number of microseconds, spinning on monotonic_ns
+        for short waits if spin_wait was set
+        :param microseconds: The time to wait
+        """
+        if self._spin_wait and microseconds < SPIN_WAIT_LIMIT_US:
+            deadline = monotonic_ns() + microseconds * 1000
+            while monotonic_ns() < deadline:
+                pass
+        else:
+            sleep(microseconds * MICROSECOND)
+
+    def _pulse_enable(self, packets: bytes):
+        """
+        Pulse the enable bit with prebuilt E-high, E-low packets in a single
+        I2C write. Only used during initialization, while the LCD is
+        still in 8-bit mode. The first call leads with _E_LOW, since the
+        PCF8574 powers up with E high.
+        :param packets: The packets to send
         """
-        Pulse the enable bit with the given byte value
-        :param byte: The data to send
+        # enable pulse must be >450ns, which a single I2C byte easily covers
+        with self.i2c:
+            self.i2c.write(packets)
+
+    def _read_byte(self, byte: int, lsb: int) -> int:
         """
-        byte_low = byte & ~FLAG_DATA_ENABLE
-        byte_high = byte | FLAG_DATA_ENABLE
+        Sends the given byte to the LCD in two 4-bit packets, sampling the
+        response while the enable bit (E) is high
 
-        # enable pulse must be >450ns
-        self.pcf.write_gpio(byte_high)
-        sleep(2 * MICROSECOND)
+        Each packet consists of 3 I2C requests:
+            - Write the packet with the enable bit (E) low, then high
+            - Read the response off of the bus while enable (E) is high
+            - Write the packet with the enable bit low
 
-        # sample response during pulse
-        response = self.pcf.read_gpio()
+        Then a packet with E and RWB low puts the LCD back into write mode,
+        since the next write raises E in its very first packet and the LCD
+        would otherwise still be driving D7-D4 at that point.
 
-        # commands need >37us to settle
-        self.pcf.write_gpio(byte_low)
-        sleep(75 * MICROSECOND)
+        The 1-byte response is read as two 1-byte I2C messages, big-endian
+        order, where D7-D4 contain the data bits and bits D3-D0 are ignored
+        (since backlight enable, E, RWB, RS are write-only values).
 
-        return response
-        
+        :param byte: The 0-255 int to send to the LCD
+        :param lsb: The backlight, RWB and RS bits of each packet
+        :return: The 0-255 int read from the LCD
+        """
+        val_nib_high = (byte & 0b11110000) | lsb
+        val_nib_low = ((byte & 0b00001111) << 4) | lsb
+
+        # Not self._frame_buf, which may still hold packets being sent one
+        # at a time, see _write_frames
+        buf = self._read_buf
+        buf[0] = val_nib_high
+        buf[1] = val_nib_high | FLAG_DATA_ENABLE
+        buf[2] = val_nib_low
+        buf[3] = val_nib_low | FLAG_DATA_ENABLE
+        buf[4] = self._backlight | FLAG_WRITE_ENABLE
+        response_buf = self._response_buf
+
+        with self.i2c:
+            self.i2c.write(buf, start=0, end=2)
+            self.i2c.readinto(response_buf, start=0, end=1)
+            self.i2c.write(buf, start=0, end=1)
+            self.i2c.write(buf, start=2, end=4)
+            self.i2c.readinto(response_buf, start=1, end=2)
+            self.i2c.write(buf, start=2, end=3)
+            self.i2c.write(buf, start=4, end=5)
+
+        return (response_buf[0] & 0b11110000) | (response_buf[1] >> 4)
+
+    def _reserve_frames(self, count: int) -> bytearray:
+        """
+        :param count: The number of bytes that will be sent to the LCD
+        :return: self._frame_buf, grown if needed to fit the packets for
+            count bytes
+        """
+        size = 4 * count
+        if len(self._frame_buf) < size:
+            self._frame_buf = bytearray(size)
+        return self._frame_buf
+
+    def _write_frames(self, size: int):
+        """
+        Writes the first size bytes of self._frame_buf in a single I2C write,
+        then waits for the LCD to execute the last byte. At up to 400 kHz the
+        bus time for each byte is longer than the time the LCD needs to
+        execute it, so only the last byte needs to be waited on. With the
+        busy flag, each byte is written and checked on its own instead.
+        :param size: The number of bytes of self._frame_buf to write
+        """
+        if self._use_busy_flag:
+            for start in range(0, size, 4):
+                with self.i2c:
+                    self.i2c.write(self._frame_buf, start=start, end=start + 4)
+                self._backlight_dirty = False
+                self._wait_for_ready(SETTLE_US)
+            return
+
+        with self.i2c:
+            self.i2c.write(self._frame_buf, end=size)
+        self._backlight_dirty = False
+        self._wait_for_execution(SETTLE_US)
 
     def _send_byte(self, byte: int):
         """
-        Sends the given byte to the LCD in two 4-bit packets
+        Sends the given byte to the LCD's instruction register in two 4-bit
+        packets
 
         D7-D4 are 4 bits of the instruction that we're sending to the LCD
         D3-D0 are the backlight, LCD enable (E), read/write (RWB), and register
@@ -299,27 +632,18 @@ class LCD:
 
         It takes two of these packets to send the full byte, big-endian order
 
-        Each packet consists of 4 I2C requests:
-            - Write the packet with the enable bit (E) low
-            - Write the packet with the enable bit (E) high
-            - Read the response off of the bus while enable (E) is high
-            - Write the packet with the enable bit low
+        Each packet is 2 bytes on the bus: the packet with the enable bit (E)
+        high, then low. The LCD latches the packet on the falling edge of E,
+        and E is always left low by the previous packet, so there's no need
+        to lead with an E-low write. All 4 bytes go out in a single I2C write.
 
-        The 1-byte response, if applicable, is read as two 1-byte I2C messages,
-        big-endian order, where D7-D4 contain the data bits and bits D3-D0 are
-        ignored (since backlight enable, E, RWB, RS are write-only values).
+        Nothing is read back, since only the busy flag check needs a
+        response; that goes through _read_byte instead.
 
         :param byte: The 0-255 int to send to the LCD
         """
-        val_nib_high = byte & 0b11110000
-        val_nib_low = (byte & 0b00001111) << 4
-
-        response_buf = 0
-
-        for idx, nib in enumerate([val_nib_high, val_nib_low]):
-            val = nib | self._lsb
-            self.pcf.write_gpio(val)
-            response_nib = self._pulse_enable(val) & 0b11110000
-            response_buf |= response_nib >> (4 * idx)
+        pack_frame(self._frame_buf, 0, byte, self._lsb_instruction)
 
-        return response_buf
+        with self.i2c:
+            self.i2c.write(self._frame_buf, end=4)
+        self._backlight_dirty = False
@@ -41,6 +41,7 @@ setup(
     author_email="",  # TODO: Add your email here
     install_requires=[
         "Adafruit-Blinka",
+        "adafruit-circuitpython-busdevice",
     ],
     # Choose your license
     license="MIT",